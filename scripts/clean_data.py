@@ -6,8 +6,319 @@ Cleans messy order data and generates quality reports.
 import pandas as pd
 import numpy as np
 import re
-from datetime import datetime
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; pandas' CSV writer is used without it
+    pa = None
+
+
+# Columns to load and their dtypes: text as pandas strings, low-cardinality
+# labels as categoricals (every column is read as text, so nothing is inferred)
+_COLUMN_DTYPES = {
+    'order_id': 'string',
+    'customer_name': 'string',
+    'email': 'string',
+    'phone': 'string',
+    'order_date': 'string',
+    'product_name': 'string',
+    'category': 'category',
+    'quantity': 'string',
+    'price': 'string',
+    'status': 'category',
+}
+
+# Columns that identify an order; rows repeating them are duplicates even if
+# other fields differ slightly (e.g. extra whitespace in the name)
+_DUPLICATE_KEY = ['order_id']
+
+# Any run of whitespace (spaces, tabs, newlines) collapses to a single space
+_WS_RE = re.compile(r'\s+')
+
+# Email validation regex pattern (compiled once at import)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# List of possible date formats in the data. ISO comes first: pandas parses it
+# with its fast C ISO-8601 path, and the formats never overlap, so order only
+# affects speed.
+_DATE_FORMATS = [
+    '%Y-%m-%d',      # 2024-01-15
+    '%m/%d/%Y',      # 01/15/2024
+    '%d-%m-%Y',      # 15-01-2024
+    '%b %d, %Y',     # Jan 15, 2024
+    '%d %B %Y',      # 15 January 2024
+]
+
+# Mapping from category variations to standard names (keys are lowercase;
+# lookups are case-insensitive so 'ELECTRONICS' and 'Elec' match too)
+_CATEGORY_MAPPING = {
+    # Electronics variations
+    'electronics': 'Electronics',
+    'elec': 'Electronics',
+    
+    # Clothing variations
+    'clothing': 'Clothing',
+    'clot': 'Clothing',
+    
+    # Home & Garden variations
+    'home & garden': 'Home & Garden',
+    'home and garden': 'Home & Garden',
+    'home': 'Home & Garden',
+    
+    # Books variations
+    'books': 'Books',
+    'book': 'Books',
+}
+
+# Mapping from status variations to standard statuses (keys are lowercase)
+_STATUS_MAPPING = {
+    # Pending variations
+    'pending': 'Pending',
+    'pnding': 'Pending',
+    'p': 'Pending',
+    
+    # Shipped variations
+    'shipped': 'Shipped',
+    'shippd': 'Shipped',
+    'ship': 'Shipped',
+    
+    # Delivered variations
+    'delivered': 'Delivered',
+    'deliverd': 'Delivered',
+    'complete': 'Delivered',
+    
+    # Cancelled variations
+    'cancelled': 'Cancelled',
+    'canceled': 'Cancelled',
+    'cnclld': 'Cancelled',
+}
+
+
+def _recode_categories(col, mapper):
+    """Map each category of a categorical column, merging categories that collide."""
+    # Only labels still in use (e.g. after dedup) become categories, so the
+    # report's breakdowns don't list labels with no rows
+    col = col.astype('category').cat.remove_unused_categories()
+    
+    # Map the handful of distinct categories instead of every row
+    new_values = col.cat.categories.map(mapper)
+    new_categories = new_values.dropna().unique()
+    
+    # Point each old code at the position of its new category
+    lookup = new_categories.get_indexer(new_values)
+    codes = col.cat.codes.to_numpy()
+    if len(lookup) == 0:
+        # No labels at all (an all-missing column): every code is already -1
+        return pd.Series(pd.Categorical.from_codes(codes, new_categories),
+                         index=col.index, name=col.name)
+    new_codes = np.where(codes >= 0, lookup[codes], -1)
+    
+    return pd.Series(pd.Categorical.from_codes(new_codes, new_categories),
+                     index=col.index, name=col.name)
+
+
+def _collapse_whitespace(text):
+    """Collapse whitespace runs in one string to a single space and strip the ends."""
+    return _WS_RE.sub(' ', text).strip()
+
+
+# Column cleaners are plain functions of one Series so they can run in worker
+# processes. The validating ones return (cleaned, number of values marked missing).
+
+def _invalidated(before, after):
+    """Count values that were present before cleaning but are missing after."""
+    return int((before.notna() & after.isna()).sum())
+
+
+def _clean_emails(emails):
+    """Lowercase emails and mark invalid ones as missing."""
+    lowered = emails.str.lower()
+    valid_emails = lowered.str.match(_EMAIL_RE, na=False)
+    invalid_count = int((~valid_emails & lowered.notna()).sum())
+    return lowered.where(valid_emails), invalid_count
+
+
+def _clean_phones(phones):
+    """Format phone numbers as XXX-XXX-XXXX, marking invalid ones as missing."""
+    # Extract only digits
+    digits = phones.astype('string').str.replace(r'\D', '', regex=True)
+    
+    # Must have exactly 10 digits after an optional leading 1 (country code);
+    # anything else becomes missing
+    parts = digits.str.extract(r'^1?(\d{3})(\d{3})(\d{4})$')
+    cleaned = parts[0] + '-' + parts[1] + '-' + parts[2]
+    return cleaned, _invalidated(phones, cleaned)
+
+
+def _parse_dates(dates):
+    """Parse known date formats into datetimes, marking invalid/future dates as missing."""
+    # Order dates repeat heavily, so parse each distinct string only once
+    uniques = pd.Series(dates.dropna().unique())
+    
+    # Try each format on all distinct values, filling only dates not yet parsed
+    remaining = uniques.astype('string').str.strip()
+    parsed = pd.Series(pd.NaT, index=remaining.index, dtype='datetime64[ns]')
+    for fmt in _DATE_FORMATS:
+        mask = parsed.isna() & remaining.notna()
+        if not mask.any():
+            break
+        parsed.loc[mask] = pd.to_datetime(remaining[mask], format=fmt, errors='coerce')
+    
+    # Future dates are invalid for orders
+    parsed = parsed.where(parsed <= pd.Timestamp.now(), pd.NaT)
+    
+    # Keep native datetimes; they are only formatted as YYYY-MM-DD when written
+    mapping = pd.Series(parsed.to_numpy(), index=uniques)
+    cleaned = dates.map(mapping)
+    return cleaned, _invalidated(dates, cleaned)
+
+
+def _clean_prices(prices):
+    """Remove currency symbols, convert to float and mark non-positive prices as missing."""
+    # Remove $ and commas, then convert to float
+    price_str = (prices.astype('string')
+                 .str.replace('$', '', regex=False)
+                 .str.replace(',', '', regex=False)
+                 .str.strip())
+    values = pd.to_numeric(price_str, errors='coerce').astype('float64')
+    
+    # Validate: price should be positive
+    cleaned = values.where(values > 0).round(2)
+    return cleaned, _invalidated(prices, cleaned)
+
+
+def _clean_quantities(quantities):
+    """Convert quantities to integers and mark non-positive ones as missing."""
+    # Convert to number and drop any fractional part
+    qty_str = quantities.astype('string').str.strip()
+    values = np.trunc(pd.to_numeric(qty_str, errors='coerce').astype('float64'))
+    
+    # Validate: quantity should be positive
+    valid = (values > 0) & np.isfinite(values)
+    cleaned = values.where(valid).astype('Int64')
+    return cleaned, _invalidated(quantities, cleaned)
+
+
+def _standardize_categories(categories):
+    """Map category variations to standard names (unmapped values are title cased)."""
+    return _recode_categories(
+        categories, lambda cat: _CATEGORY_MAPPING.get(cat.lower(), cat).title())
+
+
+def _standardize_status(statuses):
+    """Map status variations to the four standard statuses."""
+    return _recode_categories(
+        statuses, lambda status: _STATUS_MAPPING.get(status.lower(), status))
+
+
+# Column -> cleaner for the steps that only look at a single column
+_COLUMN_CLEANERS = {
+    'email': _clean_emails,
+    'phone': _clean_phones,
+    'order_date': _parse_dates,
+    'price': _clean_prices,
+    'quantity': _clean_quantities,
+    'category': _standardize_categories,
+    'status': _standardize_status,
+}
+
+# Cleaning steps in pipeline order, which is also the order of the report's actions
+_STEP_ORDER = (
+    'remove_duplicates',
+    'clean_whitespace',
+    'standardize_emails',
+    'clean_phone_numbers',
+    'standardize_dates',
+    'clean_prices',
+    'clean_quantities',
+    'standardize_categories',
+    'standardize_status',
+)
+
+
+def _summarize(df):
+    """Collect the statistics the report needs from a cleaned frame."""
+    dates = df['order_date'].dropna()
+    return {
+        'rows': len(df),
+        'columns': len(df.columns),
+        'missing': df.isna().sum(),
+        'customers': set(df['customer_name'].dropna().unique()),
+        'date_min': dates.min() if len(dates) else None,
+        'date_max': dates.max() if len(dates) else None,
+        'revenue': df['price'].sum(),
+        'priced_orders': df['price'].count(),
+        'items': df['quantity'].sum(),
+        'category_counts': df['category'].value_counts(),
+        'status_counts': df['status'].value_counts(),
+    }
+
+
+def _merge_summaries(total, part):
+    """Combine the report statistics of two chunks."""
+    if total is None:
+        return part
+    
+    def add_counts(a, b):
+        return a.add(b, fill_value=0).astype(int).sort_values(ascending=False)
+    
+    def pick(func, a, b):
+        values = [v for v in (a, b) if v is not None]
+        return func(values) if values else None
+    
+    # Grow the running set in place instead of copying it every chunk
+    total['customers'] |= part['customers']
+    return {
+        'rows': total['rows'] + part['rows'],
+        'columns': total['columns'],
+        'missing': total['missing'].add(part['missing'], fill_value=0).astype(int),
+        'customers': total['customers'],
+        'date_min': pick(min, total['date_min'], part['date_min']),
+        'date_max': pick(max, total['date_max'], part['date_max']),
+        'revenue': total['revenue'] + part['revenue'],
+        'priced_orders': total['priced_orders'] + part['priced_orders'],
+        'items': total['items'] + part['items'],
+        'category_counts': add_counts(total['category_counts'], part['category_counts']),
+        'status_counts': add_counts(total['status_counts'], part['status_counts']),
+    }
+
+
+def _worker_pool(workers):
+    """A process pool for workers > 1, otherwise a context that yields None."""
+    if workers is not None and workers > 1:
+        return ProcessPoolExecutor(max_workers=workers)
+    return nullcontext()
+
+
+def _write_csv(df, out, header=True):
+    """Write df to the open binary file out, using pyarrow's CSV writer when installed.
+    
+    Datetime columns are written as plain YYYY-MM-DD dates.
+    """
+    if pa is not None:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        # Format dates as strings so they stay quoted like the other text fields
+        for i, field in enumerate(table.schema):
+            if pa.types.is_timestamp(field.type):
+                dates = pc.strftime(table.column(i), format='%Y-%m-%d')
+                table = table.set_column(i, field.name, dates)
+        pacsv.write_csv(table, out, write_options=pacsv.WriteOptions(include_header=header))
+    else:
+        df.to_csv(out, header=header, index=False, date_format='%Y-%m-%d')
+
+
+def _format_breakdown(counts, total):
+    """Format value counts as aligned report lines: label, count, (share of total)."""
+    percentages = counts / total * 100
+    lines = (counts.index.astype(str).str.ljust(20) + ' '
+             + counts.astype(str).str.ljust(10).to_numpy() + ' ('
+             + percentages.map('{:.1f}'.format).to_numpy() + '%)')
+    return lines.tolist()
 
 
 class DataCleaner:
@@ -17,33 +328,90 @@ class DataCleaner:
         """Initialize cleaner with input file path."""
         self.input_path = input_path
         self.df = None
-        self.original_df = None
+        self.original_rows = 0
+        self.missing_before = None  # Missing values per column in the raw data
+        self.summary = None  # Report statistics accumulated by the chunked pipeline
         self.cleaning_log = []
+        self._pending = {}  # Column -> future from the worker pool
+        self._seen_rows = None  # Order ID hashes already kept by the chunked pipeline
+        self._labels = None  # Column -> distinct labels seen by the chunked pipeline
         
     def load_data(self):
         """Load the messy dataset."""
         print("📂 Loading messy dataset...")
-        self.df = pd.read_csv(self.input_path)
-        self.original_df = self.df.copy()  # Keep original for comparison
+        self.df = pd.read_csv(self.input_path, usecols=list(_COLUMN_DTYPES), dtype=_COLUMN_DTYPES)
+        
+        # Keep only the raw-data figures the report compares against
+        self.original_rows = len(self.df)
+        self.missing_before = self.df.isna().sum()
+        
+        # Figures from an earlier run on this cleaner are stale now
+        self.summary = None
+        self.cleaning_log = []
+        
         print(f"   Loaded {len(self.df)} rows, {len(self.df.columns)} columns")
         return self
     
     def log_change(self, step, description, count):
-        """Log cleaning actions for the report."""
+        """Log cleaning actions for the report (repeated steps add to one entry)."""
+        for log in self.cleaning_log:
+            if log['step'] == step:
+                log['count'] += count
+                return
+        
         self.cleaning_log.append({
             'step': step,
             'description': description,
             'count': count
         })
     
+    def _log_variations(self, col, step, description, labels_before, labels_after):
+        """Log how many label variations a standardize step consolidated.
+        
+        Chunks share labels, so the chunked pipeline only collects each chunk's
+        distinct labels here and logs the overall difference once at the end.
+        """
+        if self._labels is not None:
+            seen = self._labels.setdefault(col, {'step': step, 'description': description,
+                                                 'before': set(), 'after': set()})
+            seen['before'].update(labels_before)
+            seen['after'].update(labels_after)
+            return
+        
+        variations_removed = len(labels_before) - len(labels_after)
+        if variations_removed > 0:
+            self.log_change(step, description, variations_removed)
+    
+    def _clean_column(self, col):
+        """Return the column cleaner's result, using the worker pool's if one is pending."""
+        future = self._pending.pop(col, None)
+        if future is not None:
+            return future.result()
+        return _COLUMN_CLEANERS[col](self.df[col])
+    
     def remove_duplicates(self):
-        """Remove duplicate rows from the dataset."""
+        """Remove duplicate orders from the dataset (rows sharing an order ID)."""
         print("\n🔍 Removing duplicates...")
         
         initial_count = len(self.df)
         
-        # Remove exact duplicates
-        self.df.drop_duplicates(inplace=True)
+        # Only the key columns are hashed, not the whole row
+        keys = self.df[_DUPLICATE_KEY]
+        
+        if self._seen_rows is None:
+            duplicated = keys.duplicated()
+        else:
+            # Hash the keys so duplicates of rows from earlier chunks are caught too
+            hashes = pd.util.hash_pandas_object(keys, index=False)
+            # Probe the set per key: isin() would copy the whole set every chunk
+            seen = hashes.map(self._seen_rows.__contains__).astype(bool)
+            duplicated = hashes.duplicated() | seen
+            self._seen_rows.update(hashes[~duplicated].tolist())
+        
+        # Rows without an order ID can't be matched to another order
+        duplicated &= keys.notna().all(axis=1)
+        
+        self.df = self.df[~duplicated].reset_index(drop=True)
         
         duplicates_removed = initial_count - len(self.df)
         
@@ -64,14 +432,23 @@ class DataCleaner:
         
         for col in text_columns:
             if col in self.df.columns:
-                # Count how many have whitespace issues
-                has_whitespace = self.df[col].astype(str).str.strip() != self.df[col].astype(str)
-                count = has_whitespace.sum()
+                original = self.df[col]
                 
-                # Strip leading/trailing whitespace and collapse multiple spaces
-                self.df[col] = self.df[col].astype(str).str.strip()
-                self.df[col] = self.df[col].str.replace(r'\s+', ' ', regex=True)  # Multiple spaces -> single space
-                self.df[col] = self.df[col].str.replace('\t', ' ')  # Tabs -> space
+                if isinstance(original.dtype, pd.CategoricalDtype):
+                    # Only the few distinct labels need cleaning; a row changed if its label did
+                    labels = original.cat.categories
+                    changed = labels != labels.map(_collapse_whitespace)
+                    codes = original.cat.codes.to_numpy()
+                    count = changed[codes[codes >= 0]].sum()
+                    cleaned = _recode_categories(original, _collapse_whitespace)
+                else:
+                    # Collapse whitespace runs (incl. tabs) to one space, then strip the ends
+                    cleaned = original.astype('string').str.replace(_WS_RE, ' ', regex=True).str.strip()
+                    
+                    # Count how many values had whitespace issues
+                    count = (cleaned != original).sum()
+                
+                self.df[col] = cleaned
                 
                 if count > 0:
                     print(f"   ✓ Cleaned {count} values in '{col}'")
@@ -84,18 +461,8 @@ class DataCleaner:
         """Standardize and validate email addresses."""
         print("\n📧 Standardizing email addresses...")
         
-        # Convert to lowercase
-        self.df['email'] = self.df['email'].str.lower()
-        
-        # Email validation regex pattern
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        # Find invalid emails
-        valid_emails = self.df['email'].str.match(email_pattern, na=False)
-        invalid_count = (~valid_emails & self.df['email'].notna()).sum()
-        
-        # Mark invalid emails as NaN
-        self.df.loc[~valid_emails & self.df['email'].notna(), 'email'] = np.nan
+        # Lowercase and mark invalid emails as missing
+        self.df['email'], invalid_count = self._clean_column('email')
         
         if invalid_count > 0:
             print(f"   ✓ Converted emails to lowercase")
@@ -110,33 +477,9 @@ class DataCleaner:
         """Standardize phone numbers to XXX-XXX-XXXX format."""
         print("\n📱 Standardizing phone numbers...")
         
-        def format_phone(phone):
-            """Extract digits and format as XXX-XXX-XXXX."""
-            if pd.isna(phone):
-                return np.nan
-            
-            # Extract only digits
-            digits = re.sub(r'\D', '', str(phone))
-            
-            # Remove leading 1 if present (country code)
-            if len(digits) == 11 and digits.startswith('1'):
-                digits = digits[1:]
-            
-            # Must have exactly 10 digits
-            if len(digits) == 10:
-                return f"{digits[0:3]}-{digits[3:6]}-{digits[6:10]}"
-            else:
-                return np.nan  # Invalid phone number
-        
-        # Count non-null before cleaning
-        valid_before = self.df['phone'].notna().sum()
-        
         # Apply formatting
-        self.df['phone'] = self.df['phone'].apply(format_phone)
-        
-        # Count non-null after cleaning
+        self.df['phone'], invalid_count = self._clean_column('phone')
         valid_after = self.df['phone'].notna().sum()
-        invalid_count = valid_before - valid_after
         
         print(f"   ✓ Standardized {valid_after} phone numbers to XXX-XXX-XXXX format")
         if invalid_count > 0:
@@ -146,51 +489,12 @@ class DataCleaner:
         return self
 
     def standardize_dates(self):
-        """Convert all date formats to YYYY-MM-DD."""
+        """Convert all date formats to datetimes (saved as YYYY-MM-DD)."""
         print("\n📅 Standardizing dates...")
         
-        def parse_date(date_str):
-            """Try multiple date formats and convert to YYYY-MM-DD."""
-            if pd.isna(date_str):
-                return np.nan
-            
-            date_str = str(date_str).strip()
-            
-            # List of possible date formats in the data
-            date_formats = [
-                '%m/%d/%Y',      # 01/15/2024
-                '%d-%m-%Y',      # 15-01-2024
-                '%Y-%m-%d',      # 2024-01-15
-                '%b %d, %Y',     # Jan 15, 2024
-                '%d %B %Y',      # 15 January 2024
-            ]
-            
-            # Try each format
-            for fmt in date_formats:
-                try:
-                    parsed_date = datetime.strptime(date_str, fmt)
-                    
-                    # Check if date is in the future (invalid for orders)
-                    if parsed_date > datetime.now():
-                        return np.nan
-                    
-                    # Return in standard format
-                    return parsed_date.strftime('%Y-%m-%d')
-                except ValueError:
-                    continue
-            
-            # If no format worked, return NaN
-            return np.nan
-        
-        # Count valid dates before
-        valid_before = self.df['order_date'].notna().sum()
-        
         # Apply date parsing
-        self.df['order_date'] = self.df['order_date'].apply(parse_date)
-        
-        # Count valid dates after
+        self.df['order_date'], invalid_count = self._clean_column('order_date')
         valid_after = self.df['order_date'].notna().sum()
-        invalid_count = valid_before - valid_after
         
         print(f"   ✓ Standardized {valid_after} dates to YYYY-MM-DD format")
         if invalid_count > 0:
@@ -203,37 +507,9 @@ class DataCleaner:
         """Clean price column - remove symbols and convert to float."""
         print("\n💰 Cleaning prices...")
         
-        def parse_price(price):
-            """Remove currency symbols and convert to float."""
-            if pd.isna(price):
-                return np.nan
-            
-            # Convert to string and remove whitespace
-            price_str = str(price).strip()
-            
-            # Remove $ and commas
-            price_str = price_str.replace('$', '').replace(',', '')
-            
-            try:
-                price_float = float(price_str)
-                
-                # Validate: price should be positive
-                if price_float <= 0:
-                    return np.nan
-                
-                return round(price_float, 2)
-            except ValueError:
-                return np.nan
-        
-        # Count valid prices before
-        valid_before = self.df['price'].notna().sum()
-        
         # Apply price cleaning
-        self.df['price'] = self.df['price'].apply(parse_price)
-        
-        # Count valid prices after
+        self.df['price'], invalid_count = self._clean_column('price')
         valid_after = self.df['price'].notna().sum()
-        invalid_count = valid_before - valid_after
         
         print(f"   ✓ Cleaned {valid_after} prices (removed $, commas)")
         if invalid_count > 0:
@@ -246,31 +522,9 @@ class DataCleaner:
         """Clean quantity column - convert to integer and validate."""
         print("\n🔢 Cleaning quantities...")
         
-        def parse_quantity(qty):
-            """Convert to integer and validate."""
-            if pd.isna(qty):
-                return np.nan
-            
-            try:
-                qty_int = int(float(str(qty).strip()))
-                
-                # Validate: quantity should be positive
-                if qty_int <= 0:
-                    return np.nan
-                
-                return qty_int
-            except (ValueError, TypeError):
-                return np.nan
-        
-        # Count valid quantities before
-        valid_before = self.df['quantity'].notna().sum()
-        
         # Apply quantity cleaning
-        self.df['quantity'] = self.df['quantity'].apply(parse_quantity)
-        
-        # Count valid quantities after
+        self.df['quantity'], invalid_count = self._clean_column('quantity')
         valid_after = self.df['quantity'].notna().sum()
-        invalid_count = valid_before - valid_after
         
         print(f"   ✓ Cleaned {valid_after} quantities (converted to integers)")
         if invalid_count > 0:
@@ -283,51 +537,18 @@ class DataCleaner:
         """Standardize category names to consistent values."""
         print("\n📦 Standardizing categories...")
         
-        # Define mapping from variations to standard names
-        category_mapping = {
-            # Electronics variations
-            'electronics': 'Electronics',
-            'ELECTRONICS': 'Electronics',
-            'elec': 'Electronics',
-            'Elec': 'Electronics',
-            
-            # Clothing variations
-            'clothing': 'Clothing',
-            'CLOTHING': 'Clothing',
-            'clot': 'Clothing',
-            'Clot': 'Clothing',
-            
-            # Home & Garden variations
-            'home & garden': 'Home & Garden',
-            'HOME & GARDEN': 'Home & Garden',
-            'home and garden': 'Home & Garden',
-            'Home and Garden': 'Home & Garden',
-            'home': 'Home & Garden',
-            'Home': 'Home & Garden',
-            
-            # Books variations
-            'books': 'Books',
-            'BOOKS': 'Books',
-            'book': 'Books',
-            'Book': 'Books',
-        }
-        
-        # Count unique categories before
-        unique_before = self.df['category'].nunique()
+        # Unique categories before
+        labels_before = self.df['category'].dropna().unique()
         
         # Apply mapping (leave unmapped values as-is, then title case them)
-        self.df['category'] = self.df['category'].replace(category_mapping)
+        self.df['category'] = self._clean_column('category')
         
-        # Apply title case to any remaining values
-        self.df['category'] = self.df['category'].str.title()
+        # Unique categories after
+        labels_after = self.df['category'].dropna().unique()
         
-        # Count unique categories after
-        unique_after = self.df['category'].nunique()
-        variations_removed = unique_before - unique_after
-        
-        print(f"   ✓ Standardized categories from {unique_before} to {unique_after} unique values")
-        if variations_removed > 0:
-            self.log_change('standardize_categories', 'Category variations consolidated', variations_removed)
+        print(f"   ✓ Standardized categories from {len(labels_before)} to {len(labels_after)} unique values")
+        self._log_variations('category', 'standardize_categories', 'Category variations consolidated',
+                             labels_before, labels_after)
         
         return self
 
@@ -335,67 +556,122 @@ class DataCleaner:
         """Standardize order status values."""
         print("\n✅ Standardizing order status...")
         
-        # Define mapping from variations to standard statuses
-        status_mapping = {
-            # Pending variations
-            'pending': 'Pending',
-            'PENDING': 'Pending',
-            'pnding': 'Pending',
-            'Pnding': 'Pending',
-            'p': 'Pending',
-            'P': 'Pending',
-            
-            # Shipped variations
-            'shipped': 'Shipped',
-            'SHIPPED': 'Shipped',
-            'shippd': 'Shipped',
-            'Shippd': 'Shipped',
-            'ship': 'Shipped',
-            'Ship': 'Shipped',
-            
-            # Delivered variations
-            'delivered': 'Delivered',
-            'DELIVERED': 'Delivered',
-            'deliverd': 'Delivered',
-            'Deliverd': 'Delivered',
-            'complete': 'Delivered',
-            'Complete': 'Delivered',
-            'COMPLETE': 'Delivered',
-            
-            # Cancelled variations
-            'cancelled': 'Cancelled',
-            'CANCELLED': 'Cancelled',
-            'canceled': 'Cancelled',
-            'Canceled': 'Cancelled',
-            'cnclld': 'Cancelled',
-            'CNCLLD': 'Cancelled',
-        }
-        
-        # Count unique statuses before
-        unique_before = self.df['status'].nunique()
+        # Unique statuses before
+        labels_before = self.df['status'].dropna().unique()
         
         # Apply mapping
-        self.df['status'] = self.df['status'].replace(status_mapping)
+        self.df['status'] = self._clean_column('status')
         
-        # Count unique statuses after
-        unique_after = self.df['status'].nunique()
-        variations_removed = unique_before - unique_after
+        # Unique statuses after
+        labels_after = self.df['status'].dropna().unique()
         
-        print(f"   ✓ Standardized status from {unique_before} to {unique_after} unique values")
-        if variations_removed > 0:
-            self.log_change('standardize_status', 'Status variations consolidated', variations_removed)
+        print(f"   ✓ Standardized status from {len(labels_before)} to {len(labels_after)} unique values")
+        self._log_variations('status', 'standardize_status', 'Status variations consolidated',
+                             labels_before, labels_after)
         
         return self
 
-    def run_cleaning_pipeline(self):
-        """Execute all cleaning steps in sequence."""
+    def run_cleaning_pipeline(self, workers=None):
+        """Execute all cleaning steps in sequence.
+        
+        With workers > 1 the single-column steps are computed in parallel in a
+        process pool; each step then picks up its result and logs as usual.
+        """
         print("\n" + "="*60)
         print("🚀 STARTING DATA CLEANING PIPELINE")
         print("="*60)
         
         self.load_data()
+        with _worker_pool(workers) as executor:
+            self._run_cleaning_steps(executor)
+        
+        print("\n" + "="*60)
+        print("✅ CLEANING PIPELINE COMPLETE")
+        print("="*60)
+        
+        return self
+    
+    def run_chunked_pipeline(self, output_path, chunksize=100_000, workers=None):
+        """Clean the input chunk by chunk, appending each cleaned chunk to output_path.
+        
+        Only one chunk is held in memory at a time, so this replaces
+        run_cleaning_pipeline + save_cleaned_data for files too large to load
+        whole. Report statistics are accumulated per chunk; duplicates are
+        detected across chunks by remembering a hash of every order ID kept.
+        Category and status consolidation counts compare the distinct labels
+        of the whole file.
+        """
+        print("\n" + "="*60)
+        print("🚀 STARTING CHUNKED DATA CLEANING PIPELINE")
+        print("="*60)
+        
+        # Create output directory if it doesn't exist
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        
+        # Start every run from scratch so repeated runs don't double the figures
+        self.original_rows = 0
+        self.missing_before = None
+        self.cleaning_log = []
+        self.summary = None
+        self._seen_rows = set()
+        self._labels = {}
+        
+        # Explicit dtypes also keep every chunk's columns consistent
+        reader = pd.read_csv(self.input_path, chunksize=chunksize,
+                             usecols=list(_COLUMN_DTYPES), dtype=_COLUMN_DTYPES)
+        
+        # One worker pool serves every chunk
+        try:
+            with open(output_path, 'wb') as out, _worker_pool(workers) as executor:
+                for i, chunk in enumerate(reader):
+                    print(f"\n📂 Cleaning chunk {i + 1} ({len(chunk)} rows)...")
+                    self.df = chunk
+                    
+                    # Keep only the raw-data figures the report compares against
+                    self.original_rows += len(chunk)
+                    missing = chunk.isna().sum()
+                    if self.missing_before is None:
+                        self.missing_before = missing
+                    else:
+                        self.missing_before = self.missing_before.add(missing, fill_value=0)
+                    
+                    self._run_cleaning_steps(executor)
+                    
+                    _write_csv(self.df, out, header=(i == 0))
+                    self.summary = _merge_summaries(self.summary, _summarize(self.df))
+        finally:
+            # Drop the chunked-mode state even if a chunk fails, so a later
+            # in-memory run on this cleaner dedups and logs normally
+            self._seen_rows = None
+            labels, self._labels = self._labels, None
+        
+        self.df = None
+        
+        # Log label consolidation over the whole file, then list the actions in
+        # pipeline order whichever chunk first logged them
+        for col, seen in labels.items():
+            self._log_variations(col, seen['step'], seen['description'], seen['before'], seen['after'])
+        self.cleaning_log.sort(key=lambda log: _STEP_ORDER.index(log['step']))
+        
+        print("\n" + "="*60)
+        print("✅ CLEANING PIPELINE COMPLETE")
+        print("="*60)
+        print(f"   ✓ Cleaned data saved to: {output_path}")
+        print(f"   ✓ Total rows: {self.summary['rows']}")
+        
+        return self
+    
+    def _run_cleaning_steps(self, executor=None):
+        """Run every cleaning step on self.df, single-column steps in executor if given."""
         self.remove_duplicates()
         self.clean_whitespace()
+        
+        if executor is not None:
+            self._pending = {
+                col: executor.submit(cleaner, self.df[col])
+                for col, cleaner in _COLUMN_CLEANERS.items()
+            }
+        
         self.standardize_emails()
         self.clean_phone_numbers()
         self.standardize_dates()
@@ -403,12 +679,6 @@ class DataCleaner:
         self.clean_quantities()
         self.standardize_categories()
         self.standardize_status()
-        
-        print("\n" + "="*60)
-        print("✅ CLEANING PIPELINE COMPLETE")
-        print("="*60)
-        
-        return self
     
     def save_cleaned_data(self, output_path):
         """Save the cleaned dataset to CSV."""
@@ -418,7 +688,8 @@ class DataCleaner:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
         # Save to CSV
-        self.df.to_csv(output_path, index=False)
+        with open(output_path, 'wb') as out:
+            _write_csv(self.df, out)
         
         print(f"   ✓ Cleaned data saved to: {output_path}")
         print(f"   ✓ Total rows: {len(self.df)}")
@@ -432,80 +703,82 @@ class DataCleaner:
         # Create output directory if it doesn't exist
         os.makedirs(os.path.dirname(report_path), exist_ok=True)
         
-        with open(report_path, 'w') as f:
-            f.write("="*70 + "\n")
-            f.write("DATA CLEANING REPORT\n")
-            f.write("="*70 + "\n\n")
-            
-            # Overview
-            f.write("OVERVIEW\n")
-            f.write("-"*70 + "\n")
-            f.write(f"Original rows: {len(self.original_df)}\n")
-            f.write(f"Cleaned rows: {len(self.df)}\n")
-            f.write(f"Rows removed: {len(self.original_df) - len(self.df)}\n")
-            f.write(f"Columns: {len(self.df.columns)}\n\n")
-            
-            # Cleaning steps performed
-            f.write("CLEANING ACTIONS PERFORMED\n")
-            f.write("-"*70 + "\n")
-            for i, log in enumerate(self.cleaning_log, 1):
-                f.write(f"{i}. {log['description']}: {log['count']}\n")
-            f.write("\n")
-            
-            # Data quality before vs after
-            f.write("DATA QUALITY COMPARISON\n")
-            f.write("-"*70 + "\n")
-            f.write(f"{'Field':<20} {'Missing Before':<20} {'Missing After':<20}\n")
-            f.write("-"*70 + "\n")
-            
-            for col in self.df.columns:
-                missing_before = self.original_df[col].isna().sum()
-                missing_after = self.df[col].isna().sum()
-                f.write(f"{col:<20} {missing_before:<20} {missing_after:<20}\n")
-            
-            f.write("\n")
-            
-            # Final data statistics
-            f.write("FINAL CLEANED DATA STATISTICS\n")
-            f.write("-"*70 + "\n")
-            f.write(f"Total valid orders: {len(self.df)}\n")
-            f.write(f"Unique customers: {self.df['customer_name'].nunique()}\n")
-            # Handle date range safely
-            if self.df['order_date'].notna().any():
-                date_min = self.df['order_date'].dropna().min()
-                date_max = self.df['order_date'].dropna().max()
-                f.write(f"Date range: {date_min} to {date_max}\n")
-            else:
-                f.write(f"Date range: No valid dates\n")
-            # Handle numeric fields safely
-            total_revenue = self.df['price'].sum() if self.df['price'].notna().any() else 0
-            avg_order = self.df['price'].mean() if self.df['price'].notna().any() else 0
-            total_items = self.df['quantity'].sum() if self.df['quantity'].notna().any() else 0
-
-            f.write(f"Total revenue: ${total_revenue:,.2f}\n")
-            f.write(f"Average order value: ${avg_order:.2f}\n")
-            f.write(f"Total items sold: {int(total_items)}\n\n")
-            # Category breakdown
-            f.write("CATEGORY BREAKDOWN\n")
-            f.write("-"*70 + "\n")
-            category_counts = self.df['category'].value_counts()
-            for cat, count in category_counts.items():
-                percentage = (count / len(self.df)) * 100
-                f.write(f"{cat:<20} {count:<10} ({percentage:.1f}%)\n")
-            f.write("\n")
-            
-            # Status breakdown
-            f.write("ORDER STATUS BREAKDOWN\n")
-            f.write("-"*70 + "\n")
-            status_counts = self.df['status'].value_counts()
-            for status, count in status_counts.items():
-                percentage = (count / len(self.df)) * 100
-                f.write(f"{status:<20} {count:<10} ({percentage:.1f}%)\n")
-            f.write("\n")
-            
-            f.write("="*70 + "\n")
-            f.write("END OF REPORT\n")
-            f.write("="*70 + "\n")
+        # The chunked pipeline accumulates these; otherwise compute them now
+        summary = self.summary if self.summary is not None else _summarize(self.df)
+        rows = summary['rows']
+        
+        # Build the whole report in memory and write it in one go
+        lines = []
+        lines.append("="*70)
+        lines.append("DATA CLEANING REPORT")
+        lines.append("="*70)
+        lines.append("")
+        
+        # Overview
+        lines.append("OVERVIEW")
+        lines.append("-"*70)
+        lines.append(f"Original rows: {self.original_rows}")
+        lines.append(f"Cleaned rows: {rows}")
+        lines.append(f"Rows removed: {self.original_rows - rows}")
+        lines.append(f"Columns: {summary['columns']}")
+        lines.append("")
+        
+        # Cleaning steps performed
+        lines.append("CLEANING ACTIONS PERFORMED")
+        lines.append("-"*70)
+        for i, log in enumerate(self.cleaning_log, 1):
+            lines.append(f"{i}. {log['description']}: {log['count']}")
+        lines.append("")
+        
+        # Data quality before vs after
+        lines.append("DATA QUALITY COMPARISON")
+        lines.append("-"*70)
+        lines.append(f"{'Field':<20} {'Missing Before':<20} {'Missing After':<20}")
+        lines.append("-"*70)
+        
+        for col, missing_after in summary['missing'].items():
+            missing_before = int(self.missing_before[col])
+            lines.append(f"{col:<20} {missing_before:<20} {missing_after:<20}")
+        
+        lines.append("")
+        
+        # Final data statistics
+        lines.append("FINAL CLEANED DATA STATISTICS")
+        lines.append("-"*70)
+        lines.append(f"Total valid orders: {rows}")
+        lines.append(f"Unique customers: {len(summary['customers'])}")
+        # Handle date range safely
+        if summary['date_min'] is not None:
+            lines.append(f"Date range: {summary['date_min']:%Y-%m-%d} to {summary['date_max']:%Y-%m-%d}")
+        else:
+            lines.append(f"Date range: No valid dates")
+        # Handle numeric fields safely
+        total_revenue = summary['revenue']
+        avg_order = total_revenue / summary['priced_orders'] if summary['priced_orders'] else 0
+        total_items = summary['items']
+
+        lines.append(f"Total revenue: ${total_revenue:,.2f}")
+        lines.append(f"Average order value: ${avg_order:.2f}")
+        lines.append(f"Total items sold: {int(total_items)}")
+        lines.append("")
+        # Category breakdown
+        lines.append("CATEGORY BREAKDOWN")
+        lines.append("-"*70)
+        lines.extend(_format_breakdown(summary['category_counts'], rows))
+        lines.append("")
+        
+        # Status breakdown
+        lines.append("ORDER STATUS BREAKDOWN")
+        lines.append("-"*70)
+        lines.extend(_format_breakdown(summary['status_counts'], rows))
+        lines.append("")
+        
+        lines.append("="*70)
+        lines.append("END OF REPORT")
+        lines.append("="*70)
+        
+        with open(report_path, 'w', buffering=1 << 20) as f:
+            f.write("\n".join(lines) + "\n")
         
         print(f"   ✓ Report saved to: {report_path}")
         
@@ -527,9 +800,9 @@ if __name__ == "__main__":
     print("\n" + "="*60)
     print("📈 SUMMARY")
     print("="*60)
-    print(f"✅ Original dataset: {len(cleaner.original_df)} rows")
+    print(f"✅ Original dataset: {cleaner.original_rows} rows")
     print(f"✅ Cleaned dataset: {len(cleaner.df)} rows")
-    print(f"✅ Rows removed: {len(cleaner.original_df) - len(cleaner.df)}")
+    print(f"✅ Rows removed: {cleaner.original_rows - len(cleaner.df)}")
     print(f"✅ Data quality improved across {len(cleaner.cleaning_log)} steps")
     print("\n📁 Output files created:")
     print(f"   • {output_file}")
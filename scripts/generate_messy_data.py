@@ -1,228 +1,484 @@
 """
 Generate messy e-commerce dataset for data cleaning demonstration.
 This script creates intentional data quality issues for portfolio purposes.
+
+Running the script streams the dataset to CSV with generate_and_stream.
+generate_messy_dataset / generate_messy_columns build it in memory instead
+(optionally across num_workers processes) and are library-only API for use
+from a notebook or another script.
 """
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
 import os
+import io
+import csv
+from functools import reduce
+from concurrent.futures import ProcessPoolExecutor
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; the stdlib csv writer is used without it
+    pa = None
 
-def generate_messy_dataset(num_rows=250):
-    """Generate e-commerce dataset with intentional data quality issues."""
+# Product data with intentional inconsistencies
+_PRODUCTS = {
+    'Electronics': [
+        ('iPhone 13', 'iphone 13', 'IPHONE 13', 'iPhone13', 'Iphone 13'),
+        ('Samsung Galaxy', 'samsung galaxy', 'SAMSUNG GALAXY', 'SamsungGalaxy'),
+        ('MacBook Pro', 'macbook pro', 'MacBook  Pro', 'Macbook Pro'),
+        ('AirPods', 'airpods', 'Air Pods', 'AIRPODS')
+    ],
+    'Clothing': [
+        ("Men's T-Shirt", "mens tshirt", "MEN'S T-SHIRT", "Mens T-shirt"),
+        ('Jeans', 'jeans', 'JEANS', 'Jean'),
+        ('Running Shoes', 'running shoes', 'RUNNING SHOES', 'RunningShoes')
+    ],
+    'Home & Garden': [
+        ('Coffee Maker', 'coffee maker', 'COFFEE MAKER', 'CoffeeMaker'),
+        ('Vacuum Cleaner', 'vacuum cleaner', 'VacuumCleaner', 'Vaccuum Cleaner'),  # typo
+    ],
+    'Books': [
+        ('Python Programming', 'python programming', 'PYTHON PROGRAMMING'),
+        ('Data Science Handbook', 'data science handbook', 'DataScience Handbook')
+    ]
+}
+
+# Flattened product lookup: aligned arrays with one slot per spelling, holding
+# the spelling and the index of its category. Each slot is weighted so
+# sampling it matches picking a category, then a product, then a spelling
+# uniformly at random; the cumulative weights let a uniform draw pick a slot
+# with np.searchsorted.
+_PRODUCT_SLOTS = [
+    (c, spelling, 1 / len(_PRODUCTS) / len(category_products) / len(spellings))
+    for c, category_products in enumerate(_PRODUCTS.values())
+    for spellings in category_products for spelling in spellings
+]
+_PRODUCT_CATEGORY_IDX = np.array([c for c, _, _ in _PRODUCT_SLOTS])
+_PRODUCT_NAMES = np.array([spelling for _, spelling, _ in _PRODUCT_SLOTS], dtype=object)
+_PRODUCT_CDF = np.cumsum([weight for _, _, weight in _PRODUCT_SLOTS])
+_PRODUCT_CDF /= _PRODUCT_CDF[-1]
+
+# Category spelling variations: original, upper, lower, truncated, '&' spelled out
+_CATEGORY_VARIANTS = np.array(
+    [[c, c.upper(), c.lower(), c[:4], c.replace('&', 'and')] for c in _PRODUCTS],
+    dtype=object,
+)
+
+# Status variations
+_STATUSES = {
+    'pending': ['Pending', 'pending', 'PENDING', 'Pnding', 'P'],
+    'shipped': ['Shipped', 'shipped', 'SHIPPED', 'Shippd', 'Ship'],
+    'delivered': ['Delivered', 'delivered', 'DELIVERED', 'Deliverd', 'Complete'],
+    'cancelled': ['Cancelled', 'cancelled', 'CANCELLED', 'Canceled', 'CNCLLD']
+}
+# Every status has the same number of variants, so a uniform draw over the
+# flattened array matches picking a status and then one of its variants
+_STATUS_VARIANTS = np.array([v for variants in _STATUSES.values() for v in variants])
+
+_FIRST_NAMES = np.array(['John', 'Jane', 'Michael', 'Sarah', 'David', 'Emily', 'Robert', 'Lisa',
+                         'William', 'Maria', 'James', 'Jennifer', 'Richard', 'Linda', 'Thomas',
+                         'Christopher', 'Jessica', 'Daniel', 'Michelle', 'Matthew'])
+_LAST_NAMES = np.array(['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller',
+                        'Davis', 'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Wilson', 'Anderson',
+                        'Taylor', 'Thomas', 'Moore', 'Jackson', 'Martin', 'Lee'])
+# Case variants are computed once here and gathered per row
+_FIRST_NAMES_LOWER, _FIRST_NAMES_UPPER = np.char.lower(_FIRST_NAMES), np.char.upper(_FIRST_NAMES)
+_LAST_NAMES_LOWER, _LAST_NAMES_UPPER = np.char.lower(_LAST_NAMES), np.char.upper(_LAST_NAMES)
+
+
+# Order ID variations, prefixed to the order number
+_ORDER_ID_PREFIXES = np.array(["ORD", "#", "ORD-", "", "order"])
+
+# Invalid email templates, filled with the lowercased first (f) and last (l) name
+_INVALID_EMAIL_FORMATS = (
+    "{f}.{l}",  # No @
+    "{f}@",  # Incomplete
+    "@{l}.com",  # No username
+    "{f} {l}@email.com",  # Space
+    "invalidemail",
+)
+
+_DATE_FORMATS = (
+    "%m/%d/%Y",  # MM/DD/YYYY
+    "%d-%m-%Y",  # DD-MM-YYYY
+    "%Y-%m-%d",  # YYYY-MM-DD
+    "%b %d, %Y",  # Jan 15, 2024
+    "%d %B %Y",  # 15 January 2024
+)
+
+# Every value the low-cardinality columns can take, for categorical dtypes
+_KNOWN_CATEGORIES = {
+    'product_name': pd.unique(_PRODUCT_NAMES),
+    'category': pd.unique(_CATEGORY_VARIANTS.ravel()),
+    'status': _STATUS_VARIANTS,
+}
+
+
+def _state_cdf(*probs):
+    """Cumulative weights for a one-draw state pick: state 0 (clean) takes the
+    probability left over, states 1.. the given joint probabilities."""
+    cdf = np.cumsum([1 - sum(probs), *probs])
+    return cdf / cdf[-1]
+
+
+# Joint probabilities of the chained issue checks, so each column needs a
+# single uniform per row (a later check only applies when earlier ones failed)
+_EMAIL_STATE_CDF = _state_cdf(
+    0.15,  # missing
+    0.85 * 0.12,  # invalid
+    0.85 * 0.88 * 0.3 * 0.5,  # upper case
+    0.85 * 0.88 * 0.3 * 0.5,  # padded with spaces
+)
+_QTY_STATE_CDF = _state_cdf(
+    0.05,  # negative
+    0.95 * 0.05,  # zero
+    0.95 * 0.95 * 0.08,  # written as a string
+)
+_PRICE_STATE_CDF = _state_cdf(
+    0.25,  # '$' prefixed
+    0.75 * 0.15,  # '$' with thousands separator
+    0.75 * 0.85 * 0.10,  # written as a string
+    0.75 * 0.85 * 0.90 * 0.05,  # missing
+)
+
+
+def _draw_decisions(rng, n):
+    """Draw every random decision for n rows as index, mask and integer arrays.
     
-    # Product data with intentional inconsistencies
-    products = {
-        'Electronics': [
-            ('iPhone 13', 'iphone 13', 'IPHONE 13', 'iPhone13', 'Iphone 13'),
-            ('Samsung Galaxy', 'samsung galaxy', 'SAMSUNG GALAXY', 'SamsungGalaxy'),
-            ('MacBook Pro', 'macbook pro', 'MacBook  Pro', 'Macbook Pro'),
-            ('AirPods', 'airpods', 'Air Pods', 'AIRPODS')
-        ],
-        'Clothing': [
-            ("Men's T-Shirt", "mens tshirt", "MEN'S T-SHIRT", "Mens T-shirt"),
-            ('Jeans', 'jeans', 'JEANS', 'Jean'),
-            ('Running Shoes', 'running shoes', 'RUNNING SHOES', 'RunningShoes')
-        ],
-        'Home & Garden': [
-            ('Coffee Maker', 'coffee maker', 'COFFEE MAKER', 'CoffeeMaker'),
-            ('Vacuum Cleaner', 'vacuum cleaner', 'VacuumCleaner', 'Vaccuum Cleaner'),  # typo
-        ],
-        'Books': [
-            ('Python Programming', 'python programming', 'PYTHON PROGRAMMING'),
-            ('Data Science Handbook', 'data science handbook', 'DataScience Handbook')
-        ]
-    }
+    Chained probability checks collapse into one state index per column
+    (0 means the value is left clean), so rows can be assembled with table
+    lookups instead of per-row branching.
+    """
+    # One contiguous block of uniforms; each row feeds one probability check below
+    u = rng.random((9, n))
+    d = {}
+    
+    # Customer name variations (whitespace, case issues) - 40% get a random format
+    d['first_idx'] = rng.integers(0, len(_FIRST_NAMES), n)
+    d['last_idx'] = rng.integers(0, len(_LAST_NAMES), n)
+    d['name_style'] = np.where(u[0] < 0.4, rng.integers(0, 5, n), 0)
+    d['order_style'] = rng.integers(0, len(_ORDER_ID_PREFIXES), n)
+    
+    # Email issues: 15% missing, then 12% invalid, then 30% mixed case/padded
+    d['email_state'] = np.searchsorted(_EMAIL_STATE_CDF, u[1], side='right')
+    d['invalid_style'] = rng.integers(0, len(_INVALID_EMAIL_FORMATS), n)
+    
+    # Phone variations - 20% missing
+    d['phone_missing'] = u[2] < 0.20
+    d['area'] = rng.integers(200, 1000, n)
+    d['prefix'] = rng.integers(200, 1000, n)
+    d['line'] = rng.integers(1000, 10000, n)
+    d['phone_style'] = rng.integers(0, 6, n)
+    
+    # Date with multiple formats and some invalid: 5% future, then 3% missing
+    d['date_future'] = u[3] < 0.05
+    d['date_missing'] = u[4] < 0.03
+    d['future_days'] = rng.integers(1, 101, n)
+    d['base_days'] = rng.integers(0, 401, n)
+    d['date_style'] = rng.integers(0, len(_DATE_FORMATS), n)
+    
+    # Product selection: one weighted slot of the flattened product lookup
+    d['product_idx'] = np.searchsorted(_PRODUCT_CDF, u[5], side='right')
+    # Category variations - 30% of rows
+    d['category_style'] = np.where(u[6] < 0.3, rng.integers(0, 5, n), 0)
+    
+    # Quantity with issues: 5% negative, then 5% zero, then 8% as string
+    d['qty_state'] = np.searchsorted(_QTY_STATE_CDF, u[7], side='right')
+    d['negative_amount'] = rng.integers(1, 6, n)
+    d['base_qty'] = rng.integers(1, 11, n)
+    
+    # Price with formatting issues: 25% with $, then 15% with comma,
+    # then 10% as string, then 5% missing
+    d['base_price'] = np.round(rng.uniform(9.99, 599.99, n), 2)
+    d['price_state'] = np.searchsorted(_PRICE_STATE_CDF, u[8], side='right')
+    
+    d['status_idx'] = rng.integers(0, len(_STATUS_VARIANTS), n)
+    return d
+
+
+def _generate_rows(start, num_rows, seed):
+    """Generate rows start..start+num_rows-1 (without duplicates) as column arrays."""
+    
+    n = num_rows
+    row_idx = np.arange(start, start + n)
+    
+    # Draw every random decision for all rows up front
+    d = _draw_decisions(np.random.default_rng(seed), n)
+    first_idx, last_idx = d['first_idx'], d['last_idx']
+    first, last = _FIRST_NAMES[first_idx], _LAST_NAMES[last_idx]
+    first_lower, last_lower = _FIRST_NAMES_LOWER[first_idx], _LAST_NAMES_LOWER[last_idx]
+    
+    name_formats = [
+        (first, ' ', last),  # Normal
+        ('  ', first, '  ', last, '  '),  # Extra spaces
+        (_FIRST_NAMES_UPPER[first_idx], ' ', _LAST_NAMES_UPPER[last_idx]),  # All caps
+        (first_lower, ' ', last_lower),  # All lowercase
+        (first, '\t', last),  # Tab
+    ]
+    customer_name = np.choose(d['name_style'], [reduce(np.char.add, parts) for parts in name_formats])
+    
+    order_id = np.char.add(_ORDER_ID_PREFIXES[d['order_style']], (1000 + row_idx).astype(str))
+    
+    # Email: build the clean address for every row, then vary it by state
+    email_state = d['email_state']
+    email_base = reduce(np.char.add, (first_lower, '.', last_lower, '@example.com'))
+    email = email_base.astype(object)
+    upper, padded = email_state == 3, email_state == 4
+    email[upper] = reduce(np.char.add, (_FIRST_NAMES_UPPER[first_idx[upper]], '.',
+                                        _LAST_NAMES_UPPER[last_idx[upper]], '@EXAMPLE.COM'))
+    email[padded] = np.char.add(np.char.add('  ', email_base[padded]), '  ')
+    invalid = email_state == 2
+    email[invalid] = [_INVALID_EMAIL_FORMATS[k].format(f=f, l=l) for f, l, k in zip(
+        first_lower[invalid], last_lower[invalid], d['invalid_style'][invalid])]
+    email[email_state == 1] = np.nan
+    
+    area = d['area'].astype('U3')
+    prefix = d['prefix'].astype('U3')
+    line = d['line'].astype('U4')
+    phone_formats = [
+        ('(', area, ')-', prefix, '-', line),
+        (area, '-', prefix, '-', line),
+        (area, prefix, line),
+        ('(', area, ') ', prefix, '-', line),
+        ('+1-', area, '-', prefix, '-', line),
+        (area, '.', prefix, '.', line),
+    ]
+    phone = np.choose(d['phone_style'], [reduce(np.char.add, parts) for parts in phone_formats])
+    phone = np.where(d['phone_missing'], np.nan, phone.astype(object))
+    
+    # Only 401 distinct order dates (and 100 future ones) can occur, so format
+    # each once per style and gather the row values from those tables
+    base_dates = pd.date_range('2023-01-01', periods=401)
+    formatted_dates = np.array([base_dates.strftime(fmt) for fmt in _DATE_FORMATS], dtype=object)
+    future_dates = pd.Timestamp.now() + pd.to_timedelta(np.arange(1, 101), unit='D')
+    formatted_future = np.asarray(future_dates.strftime("%m/%d/%Y"), dtype=object)
+    
+    order_date = formatted_dates[d['date_style'], d['base_days']]
+    order_date[d['date_missing']] = np.nan
+    order_date = np.where(d['date_future'], formatted_future[d['future_days'] - 1], order_date)
+    
+    cat_idx = _PRODUCT_CATEGORY_IDX[d['product_idx']]
+    product_name = _PRODUCT_NAMES[d['product_idx']]
+    category = _CATEGORY_VARIANTS[cat_idx, d['category_style']]
+    
+    # Quantity: negative, zero or the base quantity, some written as strings
+    qty_state = d['qty_state']
+    quantity = np.select([qty_state == 1, qty_state == 2],
+                         [-d['negative_amount'], 0], d['base_qty']).astype(object)
+    as_string = qty_state == 3
+    quantity[as_string] = d['base_qty'][as_string].astype(str)
     
-    # Status variations
-    statuses = {
-        'pending': ['Pending', 'pending', 'PENDING', 'Pnding', 'P'],
-        'shipped': ['Shipped', 'shipped', 'SHIPPED', 'Shippd', 'Ship'],
-        'delivered': ['Delivered', 'delivered', 'DELIVERED', 'Deliverd', 'Complete'],
-        'cancelled': ['Cancelled', 'cancelled', 'CANCELLED', 'Canceled', 'CNCLLD']
+    # Price: '$' prefixed, '$' with thousands separator, plain string, missing or float
+    price_state = d['price_state']
+    base_price = d['base_price']
+    price = base_price.astype(object)
+    price_text = base_price.astype(str)
+    dollar, comma, as_string = price_state == 1, price_state == 2, price_state == 3
+    price[dollar] = np.char.add('$', price_text[dollar])
+    price[comma] = [f"${p:,.2f}" for p in base_price[comma].tolist()]
+    price[as_string] = price_text[as_string]
+    price[price_state == 4] = np.nan
+    
+    # Status
+    status = _STATUS_VARIANTS[d['status_idx']]
+    
+    columns = {
+        'order_id': order_id,
+        'customer_name': customer_name,
+        'email': email,
+        'phone': phone,
+        'order_date': order_date,
+        'product_name': product_name,
+        'category': category,
+        'quantity': quantity,
+        'price': price,
+        'status': status,
     }
+    return {col: np.array(values, dtype=object) for col, values in columns.items()}
+
+
+def _inject_duplicates(columns, rng, start=0, carried=0):
+    """Overwrite ~15% of rows (after the first 20) with copies of recent rows.
     
-    first_names = ['John', 'Jane', 'Michael', 'Sarah', 'David', 'Emily', 'Robert', 'Lisa', 
-                   'William', 'Maria', 'James', 'Jennifer', 'Richard', 'Linda', 'Thomas',
-                   'Christopher', 'Jessica', 'Daniel', 'Michelle', 'Matthew']
-    last_names = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 
-                  'Davis', 'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Wilson', 'Anderson',
-                  'Taylor', 'Thomas', 'Moore', 'Jackson', 'Martin', 'Lee']
-    
-    data = []
-    
-    for i in range(num_rows):
-        # 15% chance of true duplicate (exact same order with minor variations)
-        if i > 20 and random.random() < 0.15:
-            duplicate_idx = random.randint(max(0, i-50), i-1)
-            row = data[duplicate_idx].copy()
-            # Add slight variation to make it realistic duplicate
-            if random.random() < 0.5:
-                row['customer_name'] = row['customer_name'].strip()  # Remove whitespace
-            if random.random() < 0.3:
-                row['email'] = row['email'].upper() if isinstance(row['email'], str) else row['email']
-        else:
-            first_name = random.choice(first_names)
-            last_name = random.choice(last_names)
-            
-            # Customer name variations (whitespace, case issues)
-            name_formats = [
-                f"{first_name} {last_name}",  # Normal
-                f"  {first_name}  {last_name}  ",  # Extra spaces
-                f"{first_name.upper()} {last_name.upper()}",  # All caps
-                f"{first_name.lower()} {last_name.lower()}",  # All lowercase
-                f"{first_name}\t{last_name}",  # Tab
-            ]
-            customer_name = random.choice(name_formats) if random.random() < 0.4 else f"{first_name} {last_name}"
-            
-            # Order ID variations
-            order_id_formats = [
-                f"ORD{1000 + i}",
-                f"#{1000 + i}",
-                f"ORD-{1000 + i}",
-                f"{1000 + i}",
-                f"order{1000 + i}",
-            ]
-            order_id = random.choice(order_id_formats)
-            
-            # Email issues
-            if random.random() < 0.15:  # 15% missing
-                email = np.nan
-            elif random.random() < 0.12:  # 12% invalid
-                invalid_emails = [
-                    f"{first_name.lower()}.{last_name.lower()}",  # No @
-                    f"{first_name.lower()}@",  # Incomplete
-                    f"@{last_name.lower()}.com",  # No username
-                    f"{first_name.lower()} {last_name.lower()}@email.com",  # Space
-                    "invalidemail",
-                ]
-                email = random.choice(invalid_emails)
-            else:
-                email_base = f"{first_name.lower()}.{last_name.lower()}@example.com"
-                # Mix case randomly
-                if random.random() < 0.3:
-                    email = email_base.upper() if random.random() < 0.5 else f"  {email_base}  "
-                else:
-                    email = email_base
-            
-            # Phone variations
-            if random.random() < 0.20:  # 20% missing
-                phone = np.nan
-            else:
-                area = random.randint(200, 999)
-                prefix = random.randint(200, 999)
-                line = random.randint(1000, 9999)
-                phone_formats = [
-                    f"({area})-{prefix}-{line}",
-                    f"{area}-{prefix}-{line}",
-                    f"{area}{prefix}{line}",
-                    f"({area}) {prefix}-{line}",
-                    f"+1-{area}-{prefix}-{line}",
-                    f"{area}.{prefix}.{line}",
-                ]
-                phone = random.choice(phone_formats)
-            
-            # Date with multiple formats and some invalid
-            if random.random() < 0.05:  # 5% future dates (invalid)
-                order_date = (datetime.now() + timedelta(days=random.randint(1, 100))).strftime("%m/%d/%Y")
-            elif random.random() < 0.03:  # 3% missing
-                order_date = np.nan
-            else:
-                base_date = datetime(2023, 1, 1) + timedelta(days=random.randint(0, 400))
-                date_formats = [
-                    base_date.strftime("%m/%d/%Y"),  # MM/DD/YYYY
-                    base_date.strftime("%d-%m-%Y"),  # DD-MM-YYYY
-                    base_date.strftime("%Y-%m-%d"),  # YYYY-MM-DD
-                    base_date.strftime("%b %d, %Y"),  # Jan 15, 2024
-                    base_date.strftime("%d %B %Y"),  # 15 January 2024
-                ]
-                order_date = random.choice(date_formats)
-            
-            # Product selection
-            category = random.choice(list(products.keys()))
-            product_variations = random.choice(products[category])
-            product_name = random.choice(product_variations)
-            
-            # Category variations
-            if random.random() < 0.3:
-                category_variations = [category, category.upper(), category.lower(), 
-                                      category[:4], category.replace('&', 'and')]
-                category = random.choice(category_variations)
-            
-            # Quantity with issues
-            if random.random() < 0.05:  # 5% negative (invalid)
-                quantity = -random.randint(1, 5)
-            elif random.random() < 0.05:  # 5% zero (questionable)
-                quantity = 0
-            elif random.random() < 0.08:  # 8% as string
-                quantity = str(random.randint(1, 10))
-            else:
-                quantity = random.randint(1, 10)
+    When streaming, the arrays begin with `carried` already-written rows kept
+    only as copy sources, and `start` is the dataset row number of position 0.
+    """
+    n = len(columns['order_id'])
+    row_idx = np.arange(n)
+    u = rng.random((3, n))
+    
+    # 15% chance of true duplicate (exact same order with minor variations),
+    # copied from one of the previous 50 rows
+    is_duplicate = (row_idx >= carried) & (start + row_idx > 20) & (u[0] < 0.15)
+    duplicate_src = rng.integers(np.maximum(0, row_idx - 50), np.maximum(row_idx, 1))
+    strip_name = is_duplicate & (u[1] < 0.5)
+    upper_email = is_duplicate & (u[2] < 0.3)
+    
+    # A duplicate of a duplicate copies the already-varied row, so follow each
+    # chain back to its original row by pointer jumping, collecting the
+    # variations applied along the way
+    source = np.where(is_duplicate, duplicate_src, row_idx)
+    while (source[source] != source).any():
+        strip_name |= strip_name[source]
+        upper_email |= upper_email[source]
+        source = source[source]
+    
+    for values in columns.values():
+        values[is_duplicate] = values[source[is_duplicate]]
+    
+    # Add slight variation to make it realistic duplicate
+    names = columns['customer_name']
+    names[strip_name] = np.char.strip(names[strip_name].astype(str))  # Remove whitespace
+    emails = columns['email']
+    upper_email &= pd.notna(emails)
+    emails[upper_email] = np.char.upper(emails[upper_email].astype(str))
+
+
+def generate_messy_columns(num_rows=250, num_workers=None, seed=42):
+    """Generate the messy dataset as a dict of column arrays."""
+    num_chunks = num_workers if num_workers and num_workers > 1 else 1
+    bounds = np.linspace(0, num_rows, num_chunks + 1).astype(int)
+    starts, sizes = bounds[:-1], np.diff(bounds)
+    
+    # One seed drives everything: independent child streams for each chunk
+    # and for the duplicate pass
+    *seeds, duplicate_seed = np.random.SeedSequence(seed).spawn(num_chunks + 1)
+    
+    # Rows are independent, so large datasets are generated in parallel chunks
+    if num_chunks > 1:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            chunks = list(executor.map(_generate_rows, starts, sizes, seeds))
+        columns = {col: np.concatenate([chunk[col] for chunk in chunks]) for col in chunks[0]}
+    else:
+        columns = _generate_rows(0, num_rows, seeds[0])
+    
+    # Duplicates may copy rows from another chunk, so inject them after the merge
+    _inject_duplicates(columns, np.random.default_rng(duplicate_seed))
+    return columns
+
+
+def _to_frame(columns):
+    """Wrap generated columns in a DataFrame, small variant sets as categoricals."""
+    frame = dict(columns)
+    for col, categories in _KNOWN_CATEGORIES.items():
+        frame[col] = pd.Categorical(frame[col], categories=categories)
+    return pd.DataFrame(frame, copy=False)
+
+
+def generate_messy_dataset(num_rows=250, num_workers=None, seed=42):
+    """Generate e-commerce dataset with intentional data quality issues."""
+    return _to_frame(generate_messy_columns(num_rows, num_workers, seed))
+
+
+def _csv_values(columns):
+    """Column arrays as plain CSV field values, missing values as empty fields."""
+    return [np.where(pd.isna(col), '', col) for col in columns.values()]
+
+
+def _write_csv(columns, out, header=True):
+    """Write column arrays to the open binary file out, using pyarrow's CSV writer when installed.
+    
+    Mixed-type columns are written as text; missing values become empty fields.
+    """
+    if pa is not None:
+        table = pa.table({
+            col: pa.array([str(v) for v in values], pa.string(), mask=pd.isna(values))
+            for col, values in columns.items()
+        })
+        pacsv.write_csv(table, out, write_options=pacsv.WriteOptions(include_header=header))
+    else:
+        text = io.TextIOWrapper(out, newline='', write_through=True)
+        writer = csv.writer(text, lineterminator='\n')
+        if header:
+            writer.writerow(columns.keys())
+        writer.writerows(zip(*_csv_values(columns)))
+        text.detach()
+
+
+def generate_and_stream(num_rows, output_path, chunk_rows=100_000, seed=42):
+    """Generate the dataset chunk by chunk straight to CSV and return summary counts.
+    
+    No DataFrame is built: between chunks only the counters, the last 50 rows
+    (the duplicate look-back window) and one hash per distinct row written
+    are kept. The hashes are needed for the exact duplicate-row count, so
+    memory still grows with num_rows, at one integer per row.
+    
+    Each chunk draws from its own child of seed, so the same seed gives the
+    same file only for the same chunk_rows. The rows also differ from
+    generate_messy_columns with that seed.
+    """
+    missing = dict.fromkeys(['email', 'phone', 'price', 'order_date'], 0)
+    variations = {col: set() for col in ('product_name', 'category', 'status')}
+    seen_rows = set()
+    sample = None
+    tail = None
+    
+    starts = range(0, num_rows, chunk_rows)
+    seeds = np.random.SeedSequence(seed).spawn(2 * len(starts))
+    
+    with open(output_path, 'wb') as out:
+        for start, row_seed, duplicate_seed in zip(starts, seeds[::2], seeds[1::2]):
+            columns = _generate_rows(start, min(chunk_rows, num_rows - start), row_seed)
             
-            # Price with formatting issues
-            base_price = round(random.uniform(9.99, 599.99), 2)
-            if random.random() < 0.25:  # 25% with $ symbol
-                price = f"${base_price}"
-            elif random.random() < 0.15:  # 15% with comma
-                price = f"${base_price:,.2f}"
-            elif random.random() < 0.10:  # 10% as string without $
-                price = str(base_price)
-            elif random.random() < 0.05:  # 5% missing
-                price = np.nan
-            else:
-                price = base_price
+            # Prepend the previous chunk's tail so duplicates can copy across chunks
+            carried = 0 if tail is None else len(tail['order_id'])
+            if carried:
+                columns = {col: np.concatenate([tail[col], values]) for col, values in columns.items()}
+            _inject_duplicates(columns, np.random.default_rng(duplicate_seed), start - carried, carried)
+            tail = {col: values[-50:] for col, values in columns.items()}
+            columns = {col: values[carried:] for col, values in columns.items()}
             
-            # Status
-            status_category = random.choice(list(statuses.keys()))
-            status = random.choice(statuses[status_category])
+            _write_csv(columns, out, header=sample is None)
+            if sample is None:
+                sample = {col: values[:10] for col, values in columns.items()}
+            for col in missing:
+                missing[col] += int(pd.isna(columns[col]).sum())
+            for col, seen in variations.items():
+                seen.update(pd.unique(columns[col]))
             
-            row = {
-                'order_id': order_id,
-                'customer_name': customer_name,
-                'email': email,
-                'phone': phone,
-                'order_date': order_date,
-                'product_name': product_name,
-                'category': category,
-                'quantity': quantity,
-                'price': price,
-                'status': status,
-            }
+            seen_rows.update(map(hash, zip(*_csv_values(columns))))
         
-        data.append(row)
+        if sample is None:
+            # No rows at all: still write the header so the file reads back as an empty table
+            sample = _generate_rows(0, 0, np.random.SeedSequence(seed))
+            _write_csv(sample, out)
     
-    return pd.DataFrame(data)
+    return {
+        'rows': num_rows,
+        'missing': missing,
+        'duplicates': num_rows - len(seen_rows),
+        'variations': {col: len(seen) for col, seen in variations.items()},
+        'sample': sample,
+    }
 
 
 if __name__ == "__main__":
     # Generate dataset
     print("🔄 Generating messy e-commerce dataset...")
-    df = generate_messy_dataset(250)
     
     # Create output directory if it doesn't exist
     os.makedirs('data/raw', exist_ok=True)
     
-    # Save to data/raw folder
+    # Stream rows straight to data/raw, counting issues as they are written
     output_path = 'data/raw/ecommerce_orders_messy.csv'
-    df.to_csv(output_path, index=False)
+    summary = generate_and_stream(250, output_path)
     
     print(f"\n✅ Dataset saved to: {output_path}")
-    print(f"   Total rows: {len(df)}")
+    print(f"   Total rows: {summary['rows']}")
     
     # Display summary statistics
+    missing = summary['missing']
+    variations = summary['variations']
     print("\n=== DATA QUALITY ISSUES SUMMARY ===")
-    print(f"1. Missing emails: {df['email'].isna().sum()}")
-    print(f"2. Missing phones: {df['phone'].isna().sum()}")
-    print(f"3. Missing prices: {df['price'].isna().sum()}")
-    print(f"4. Missing dates: {df['order_date'].isna().sum()}")
-    print(f"5. Duplicate rows: {df.duplicated().sum()}")
-    print(f"6. Unique product name variations: {df['product_name'].nunique()}")
-    print(f"7. Unique category variations: {df['category'].nunique()}")
-    print(f"8. Unique status variations: {df['status'].nunique()}")
+    print(f"1. Missing emails: {missing['email']}")
+    print(f"2. Missing phones: {missing['phone']}")
+    print(f"3. Missing prices: {missing['price']}")
+    print(f"4. Missing dates: {missing['order_date']}")
+    print(f"5. Duplicate rows: {summary['duplicates']}")
+    print(f"6. Unique product name variations: {variations['product_name']}")
+    print(f"7. Unique category variations: {variations['category']}")
+    print(f"8. Unique status variations: {variations['status']}")
     
     print("\n📊 Sample of messy data:")
-    print(df.head(10).to_string())
\ No newline at end of file
+    print(pd.DataFrame(summary['sample']).to_string())
\ No newline at end of file